@@ -100,6 +100,7 @@ from numpy import float32  # NOQA
 from numpy import float64  # NOQA
 
 
+from cupy.core import prefetch_kernels  # NOQA
 from cupy.core import ufunc  # NOQA
 
 from numpy import newaxis  # == None  # NOQA
@@ -152,6 +152,10 @@ public:
     return size_;
   }
 
+  __device__ T* data() const {
+    return data_;
+  }
+
   __device__ const int* shape() const {
     return shape_;
   }
@@ -201,6 +205,10 @@ public:
     return size_;
   }
 
+  __device__ T* data() const {
+    return data_;
+  }
+
   __device__ T& operator[](const int* idx) {
     return *reinterpret_cast<T*>(data_);
   }
@@ -1,5 +1,3 @@
-import string
-
 import numpy
 import six
 
@@ -9,27 +7,38 @@ from cupy.cuda cimport device
 from cupy.cuda cimport function
 
 
-cpdef _get_simple_elementwise_kernel(
-        params, operation, name, preamble,
-        loop_prep='', after_loop='', options=()):
-    module_code = string.Template('''
-    ${preamble}
-    extern "C" __global__ void ${name}(${params}) {
-      ${loop_prep};
-      CUPY_FOR(i, _ind.size()) {
+cdef str _simple_elementwise_template = '''
+    {preamble}
+    extern "C" __global__ void {name}({params}) {{
+      {loop_prep};
+      CUPY_FOR(i, _ind.size()) {{
         _ind.set(i);
-        ${operation};
-      }
-      ${after_loop};
-    }
-    ''').substitute(
+        {operation};
+      }}
+      {after_loop};
+    }}
+    '''
+
+
+@util.memoize(for_each_device=True)
+def _get_simple_elementwise_module(
+        params, operation, name, preamble, loop_prep, after_loop, options):
+    module_code = _simple_elementwise_template.format(
         params=params,
         operation=operation,
         name=name,
         preamble=preamble,
         loop_prep=loop_prep,
         after_loop=after_loop)
-    module = compile_with_cache(module_code, options)
+    return compile_with_cache(module_code, options)
+
+
+cpdef _get_simple_elementwise_kernel(
+        params, operation, name, preamble,
+        loop_prep='', after_loop='', options=()):
+    module = _get_simple_elementwise_module(
+        params, operation, name, preamble, loop_prep, after_loop,
+        tuple(options))
     return module.get_function(name)
 
 
@@ -50,9 +59,13 @@ cdef dict _typenames_base = {
 
 cdef str _all_type_chars = 'dfeqlihbQLIHB?'
 
+# Type names keyed by every common dtype specifier, so that most lookups do
+# not need to normalize the specifier with numpy.dtype.
 cdef dict _typenames = {
-    numpy.dtype(i).type: _typenames_base[numpy.dtype(i)]
-    for i in _all_type_chars}
+    key: _typenames_base[numpy.dtype(i)]
+    for i in _all_type_chars
+    for key in (numpy.dtype(i), numpy.dtype(i).type, numpy.dtype(i).char,
+                numpy.dtype(i).str, numpy.dtype(i).name)}
 
 cdef tuple _python_scalar_type = six.integer_types + (float, bool)
 cdef tuple _numpy_scalar_type = tuple([numpy.dtype(i).type
@@ -61,6 +74,10 @@ cdef tuple _numpy_scalar_type = tuple([numpy.dtype(i).type
 cdef set _python_scalar_type_set = set(_python_scalar_type)
 cdef set _numpy_scalar_type_set = set(_numpy_scalar_type)
 
+cdef dict _cast_table = {
+    (from_type, to_type): numpy.can_cast(from_type, to_type)
+    for from_type in _numpy_scalar_type for to_type in _numpy_scalar_type}
+
 cdef dict _kind_score = {
     'b': 0,
     'u': 1,
@@ -79,14 +96,16 @@ for i in six.integer_types:
 cpdef str _get_typename(dtype):
     if dtype is None:
         raise ValueError('dtype is None')
-    if dtype not in _typenames:
-        dtype = numpy.dtype(dtype).type
-    return _typenames[dtype]
+    name = _typenames.get(dtype)
+    if name is None:
+        name = _typenames[numpy.dtype(dtype).type]
+    return name
 
 
 cpdef list _preprocess_args(args):
     cdef list ret = []
     cdef int dev_id = device.get_device_id()
+    cdef int arr_dev_id
 
     for arg in args:
         if type(arg) in _python_scalar_type_set:
@@ -94,12 +113,12 @@ cpdef list _preprocess_args(args):
         elif type(arg) in _numpy_scalar_type_set:
             pass
         elif isinstance(arg, ndarray):
-            arr_dev = (<ndarray?>arg).data.device
-            if arr_dev is not None and arr_dev.id != dev_id:
+            arr_dev_id = (<ndarray>arg).data.device_id
+            if arr_dev_id != -1 and arr_dev_id != dev_id:
                 raise ValueError(
                     'Array device must be same as the current '
                     'device: array device = %d while current = %d'
-                    % (arr_dev.id, dev_id))
+                    % (arr_dev_id, dev_id))
         elif isinstance(arg, _python_scalar_type + _numpy_scalar_type):
             arg = numpy.dtype(type(arg)).type(arg)
             assert arg in _numpy_scalar_type
@@ -121,22 +140,20 @@ cpdef tuple _get_args_info(list args):
     return tuple(ret)
 
 
-cpdef str _get_kernel_params(tuple params, tuple args_info):
+@util.memoize()
+def _get_kernel_params(tuple params, tuple args_info):
     cdef ParameterInfo p
     ret = []
     for i in range(len(params)):
         p = params[i]
         type, dtype, ndim = <tuple>(args_info[i])
-        is_array = type is ndarray
         if type is Indexer:
-            t = 'CIndexer<%d>' % ndim
+            ret.append('CIndexer<%d> %s' % (ndim, p.name))
+        elif type is ndarray:
+            ret.append('CArray<%s, %d> %s' % (
+                _get_typename(dtype), ndim, p.array_param_name))
         else:
-            t = _get_typename(dtype)
-            if is_array:
-                t = 'CArray<%s, %d>' % (t, ndim)
-        ret.append('%s %s%s' % (t,
-                                '_raw_' if is_array and not p.raw else '',
-                                p.name))
+            ret.append('%s %s' % (_get_typename(dtype), p.name))
     return ', '.join(ret)
 
 
@@ -147,23 +164,43 @@ cpdef tuple _reduce_dims(list args, tuple params, tuple shape):
     cdef vector.vector[vector.vector[Py_ssize_t]] args_strides
     cdef ParameterInfo p
     cdef ndarray arr, view
-    cdef bint flag
+    cdef bint flag, all_c_contiguous
 
     ndim = len(shape)
     if ndim <= 1:
         return args, shape
 
+    vecshape = shape
     n = len(args)
+    all_c_contiguous = True
     for i in range(n):
         p = params[i]
         a = args[i]
         flag = not p.raw and isinstance(a, ndarray)
         is_array_flags.push_back(flag)
-        if flag:
-            arr = a
+        if flag and not (<ndarray>a)._c_contiguous:
+            all_c_contiguous = False
+
+    if all_c_contiguous:
+        # Every axis is mergeable, so the arrays are viewed as 1-D without
+        # checking the strides axis by axis.
+        newshape.assign(<Py_ssize_t>1, internal.prod_ssize_t(vecshape))
+        ret = []
+        for i, a in enumerate(args):
+            if is_array_flags[i]:
+                arr = a
+                arr = arr.view()
+                newstrides.assign(<Py_ssize_t>1, <Py_ssize_t>arr.itemsize)
+                arr._set_shape_and_strides(newshape, newstrides, False)
+                a = arr
+            ret.append(a)
+        return ret, tuple(newshape)
+
+    for i in range(n):
+        if is_array_flags[i]:
+            arr = args[i]
             args_strides.push_back(arr._strides)
 
-    vecshape = shape
     axis = -1
     cnt = 0
     for i in range(1, ndim):
@@ -215,6 +252,11 @@ cpdef tuple _reduce_dims(list args, tuple params, tuple shape):
     return ret, tuple(newshape)
 
 
+# Parameters sharing a type placeholder (e.g. ``T``) share a group ID, which
+# indexes the types decided in _decide_params_type.
+cdef dict _ctype_groups = {}
+
+
 cdef class ParameterInfo:
     cdef:
         readonly str name
@@ -222,6 +264,10 @@ cdef class ParameterInfo:
         readonly str ctype
         readonly bint raw
         readonly bint is_const
+        int type_group
+        str array_param_name
+        str array_load
+        str array_load_contiguous
 
     def __init__(self, str param, bint is_const):
         self.name = None
@@ -251,6 +297,24 @@ cdef class ParameterInfo:
             else:
                 raise Exception('Unknown keyword "%s"' % i)
 
+        self.type_group = -1
+        if self.dtype is None and self.ctype is not None:
+            self.type_group = _ctype_groups.setdefault(
+                self.ctype, len(_ctype_groups))
+
+        self.array_load = None
+        self.array_load_contiguous = None
+        if self.raw:
+            self.array_param_name = self.name
+        else:
+            self.array_param_name = '_raw_' + self.name
+            if self.ctype is not None:
+                self.array_load = '{t} &{n} = _raw_{n}[_ind.get()];'.format(
+                    t=self.ctype, n=self.name)
+                self.array_load_contiguous = \
+                    '{t} &{n} = _raw_{n}.data()[i];'.format(
+                        t=self.ctype, n=self.name)
+
 
 @util.memoize()
 def _get_param_info(s, is_const):
@@ -259,52 +323,91 @@ def _get_param_info(s, is_const):
     return tuple([ParameterInfo(i, is_const) for i in s.strip().split(',')])
 
 
+cdef _set_param_type(ParameterInfo p, a, list group_types, list decided):
+    if p.dtype is not None:
+        if a is not p.dtype and numpy.dtype(a) != numpy.dtype(p.dtype):
+            raise TypeError(
+                'Type is mismatched. %s %s %s' % (p.name, a, p.dtype))
+        return
+    t = group_types[p.type_group]
+    if t is None:
+        group_types[p.type_group] = a
+        decided.append(p)
+    elif a is not t and numpy.dtype(t) != numpy.dtype(a):
+        raise TypeError(
+            'Type is mismatched. %s %s %s %s' % (p.name, a, t, p.ctype))
+
+
+cdef tuple _get_param_types(tuple params, list group_types):
+    cdef ParameterInfo p
+    ret = []
+    for p in params:
+        if p.dtype is not None:
+            ret.append(p.dtype)
+        else:
+            t = group_types[p.type_group]
+            if t is None:
+                raise KeyError(p.ctype)
+            ret.append(t)
+    return tuple(ret)
+
+
 @util.memoize()
 def _decide_params_type(in_params, out_params, in_args_dtype, out_args_dtype):
-    type_dict = {}
+    cdef ParameterInfo p
+    cdef list group_types = [None] * len(_ctype_groups)
+    cdef list decided = []
     if out_args_dtype:
         assert len(out_params) == len(out_args_dtype)
-        for p, a in six.moves.zip(out_params, out_args_dtype):
+        for p, a in zip(out_params, out_args_dtype):
             if a is None:
                 raise TypeError('Output arguments must be cupy.ndarray')
-            if p.dtype is not None:
-                if numpy.dtype(a) != numpy.dtype(p.dtype):
-                    raise TypeError(
-                        'Type is mismatched. %s %s %s' % (p.name, a, p.dtype))
-            elif p.ctype in type_dict:
-                t = type_dict[p.ctype]
-                if numpy.dtype(t) != numpy.dtype(a):
-                    raise TypeError(
-                        'Type is mismatched. %s %s %s %s' % (
-                            p.name, a, t, p.ctype))
-            else:
-                type_dict[p.ctype] = a
+            _set_param_type(p, a, group_types, decided)
 
     assert len(in_params) == len(in_args_dtype)
-    unknown_ctype = []
-    for p, a in six.moves.zip(in_params, in_args_dtype):
-        if a is None:
-            if p.dtype is None:
-                unknown_ctype.append(p.ctype)
-        else:
-            if p.dtype is not None:
-                if numpy.dtype(a) != numpy.dtype(p.dtype):
-                    raise TypeError(
-                        'Type is mismatched. %s %s %s' % (p.name, a, p.dtype))
-            elif p.ctype in type_dict:
-                t = type_dict[p.ctype]
-                if numpy.dtype(t) != numpy.dtype(a):
-                    raise TypeError(
-                        'Type is mismatched. %s %s %s %s' % (
-                            p.name, a, t, p.ctype))
-            else:
-                type_dict[p.ctype] = a
+    for p, a in zip(in_params, in_args_dtype):
+        if a is not None:
+            _set_param_type(p, a, group_types, decided)
+
+    in_types = _get_param_types(in_params, group_types)
+    out_types = _get_param_types(out_params, group_types)
+    types = tuple([(p.ctype, group_types[p.type_group]) for p in decided])
+    return in_types, out_types, types
+
+
+cdef bint _is_contiguous_1d(list args, tuple params, tuple shape):
+    # Whether every array can be indexed by the loop counter directly.
+    cdef Py_ssize_t i
+    cdef ParameterInfo p
+    cdef ndarray arr
+    if len(shape) != 1:
+        return False
+    for i in range(len(args)):
+        p = params[i]
+        a = args[i]
+        if not p.raw and isinstance(a, ndarray):
+            arr = a
+            if arr._strides[0] != arr.itemsize:
+                return False
+    return True
+
 
-    in_types = tuple([type_dict[p.ctype] if p.dtype is None else p.dtype
-                      for p in in_params])
-    out_types = tuple([type_dict[p.ctype] if p.dtype is None else p.dtype
-                       for p in out_params])
-    return in_types, out_types, tuple(type_dict.items())
+cdef tuple _fast_broadcast(list args):
+    # Returns ``args`` itself without constructing a broadcast object if all
+    # the arrays in it already have the same shape.
+    cdef ndarray arr, first = None
+    for a in args:
+        if isinstance(a, ndarray):
+            arr = a
+            if first is None:
+                first = arr
+            elif not internal.vector_equal(arr._shape, first._shape):
+                break
+    else:
+        if first is not None:
+            return args, tuple(first._shape)
+    brod = broadcast(*args)
+    return list(brod.values), brod.shape
 
 
 cdef tuple _broadcast(list args, tuple params, bint use_size):
@@ -331,14 +434,16 @@ cdef tuple _broadcast(list args, tuple params, bint use_size):
     else:
         if not is_not_none:
             raise ValueError('Loop size is Undecided')
-    brod = broadcast(*value)
+    values, shape = _fast_broadcast(value)
+    if values is value:
+        return args, shape
     value = []
     for i in range(len(args)):
-        a = brod.values[i]
+        a = values[i]
         if a is None:
             a = args[i]
         value.append(a)
-    return value, brod.shape
+    return value, shape
 
 
 cdef list _get_out_args(list out_args, tuple out_types, tuple out_shape,
@@ -387,20 +492,20 @@ cdef list _get_out_args_with_params(
 
 @util.memoize(for_each_device=True)
 def _get_elementwise_kernel(args_info, types, params, operation, name,
-                            preamble, kwargs):
+                            preamble, kwargs, contiguous_1d=False):
+    cdef ParameterInfo p
     kernel_params = _get_kernel_params(params, args_info)
     types_preamble = '\n'.join(
         'typedef %s %s;' % (_get_typename(v), k) for k, v in types)
     preamble = types_preamble + '\n' + preamble
 
     op = []
-    for p, a in six.moves.zip(params, args_info):
+    for p, a in zip(params, args_info):
         if not p.raw and a[0] == ndarray:
-            if p.is_const:
-                fmt = '{t} &{n} = _raw_{n}[_ind.get()];'
+            if contiguous_1d:
+                op.append(p.array_load_contiguous)
             else:
-                fmt = '{t} &{n} = _raw_{n}[_ind.get()];'
-            op.append(fmt.format(t=p.ctype, n=p.name))
+                op.append(p.array_load)
     op.append(operation)
     operation = '\n'.join(op)
     return _get_simple_elementwise_kernel(
@@ -456,6 +561,9 @@ cdef class ElementwiseKernel:
         readonly bint reduce_dims
         readonly str preamble
         readonly object kwargs
+        dict _params_type_memo
+        dict _kernel_memo
+        object __weakref__
 
     def __init__(self, in_params, out_params, operation,
                  name='kernel', reduce_dims=True, preamble='', **kwargs):
@@ -466,11 +574,14 @@ cdef class ElementwiseKernel:
         self.nargs = self.nin + self.nout
         param_rest = _get_param_info('CIndexer _ind', False)
         self.params = self.in_params + self.out_params + param_rest
-        self.operation = operation
-        self.name = name
+        self.operation = six.moves.intern(operation)
+        self.name = six.moves.intern(name)
         self.reduce_dims = reduce_dims
-        self.preamble = preamble
+        self.preamble = six.moves.intern(preamble)
         self.kwargs = frozenset(kwargs.items())
+        self._params_type_memo = {}
+        self._kernel_memo = {}
+        util.register_memo(self, self._kernel_memo)
         names = [p.name for p in self.in_params + self.out_params]
         if 'i' in names:
             raise ValueError("Can not use 'i' as a parameter name")
@@ -516,9 +627,14 @@ cdef class ElementwiseKernel:
              for a in in_args])
         out_ndarray_types = tuple([a.dtype.type for a in out_args])
 
-        in_types, out_types, types = _decide_params_type(
-            self.in_params, self.out_params,
-            in_ndarray_types, out_ndarray_types)
+        key = (in_ndarray_types, out_ndarray_types)
+        params_type = self._params_type_memo.get(key)
+        if params_type is None:
+            params_type = _decide_params_type(
+                self.in_params, self.out_params,
+                in_ndarray_types, out_ndarray_types)
+            self._params_type_memo[key] = params_type
+        in_types, out_types, types = params_type
 
         is_size_specified = False
         if size is not None:
@@ -542,35 +658,80 @@ cdef class ElementwiseKernel:
         if self.reduce_dims:
             inout_args, shape = _reduce_dims(
                 inout_args, self.params, shape)
+        contiguous_1d = _is_contiguous_1d(inout_args, self.params, shape)
         indexer = Indexer(shape)
         inout_args.append(indexer)
 
         args_info = _get_args_info(inout_args)
-        kern = _get_elementwise_kernel(
-            args_info, types, self.params, self.operation,
-            self.name, self.preamble, self.kwargs)
+        key = (device.get_device_id(), args_info, types, contiguous_1d)
+        kern = self._kernel_memo.get(key)
+        if kern is None:
+            kern = _get_elementwise_kernel(
+                args_info, types, self.params, self.operation,
+                self.name, self.preamble, self.kwargs, contiguous_1d)
+            self._kernel_memo[key] = kern
         kern.linear_launch(indexer.size, inout_args, shared_mem=0,
                            block_max_size=128, stream=stream)
         return ret
 
+    def _warmup(self, in_types, int ndim=1):
+        # Compiles the kernel without launching it. See prefetch_kernels for
+        # the arguments.
+        cdef ParameterInfo p
+        for p in self.params[:self.nargs]:
+            if p.raw:
+                raise TypeError(
+                    'Cannot prefetch %s with raw parameters' % self.name)
+        array_types, scalars = _get_warmup_in_types(
+            in_types, self.nin, self.name)
+        in_types, out_types, types = _decide_params_type(
+            self.in_params, self.out_params, array_types, ())
+        args_info = [(ndarray, t, ndim) if array_types[i] is not None
+                     else (t, t, 0) for i, t in enumerate(in_types)]
+        args_info += [(ndarray, t, ndim) for t in out_types]
+        args_info.append((Indexer, None, ndim))
+        return _get_elementwise_kernel(
+            tuple(args_info), types, self.params, self.operation,
+            self.name, self.preamble, self.kwargs, ndim == 1)
+
+
+cdef tuple _get_warmup_in_types(in_types, Py_ssize_t nin, str name):
+    # Splits ``in_types`` given to _warmup into the dtypes of the arrays, which
+    # are None for scalars, and the scalars converted as in __call__.
+    in_types = tuple(in_types)
+    if len(in_types) != nin:
+        raise TypeError('Wrong number of arguments for %s' % name)
+    array_types = []
+    scalars = []
+    for t in in_types:
+        if isinstance(t, _python_scalar_type + _numpy_scalar_type):
+            array_types.append(None)
+            scalars.append(_preprocess_args((t,))[0])
+        else:
+            array_types.append(numpy.dtype(t).type)
+            scalars.append(None)
+    return tuple(array_types), scalars
+
 
 @util.memoize(for_each_device=True)
 def _get_ufunc_kernel(
-        in_types, out_types, routine, args_info, params, name, preamble):
+        in_types, out_types, routine, args_info, params, name, preamble,
+        contiguous_1d=False):
     kernel_params = _get_kernel_params(params, args_info)
+    index = '.data()[i]' if contiguous_1d else '[_ind.get()]'
 
     types = []
     op = []
     for i, x in enumerate(in_types):
         types.append('typedef %s in%d_type;' % (_get_typename(x), i))
         if args_info[i][0] is ndarray:
-            op.append(
-                'const in{0}_type in{0} = _raw_in{0}[_ind.get()];'.format(i))
+            op.append('const in{0}_type in{0} = _raw_in{0}{1};'.format(
+                i, index))
 
     for i, x in enumerate(out_types):
         types.append('typedef %s out%d_type;' % (_get_typename(x), i))
-        op.append('{1} &out{0} = _raw_out{0}[_ind.get()];'.format(
-            i, _get_typename(args_info[i + len(in_types)][1])))
+        op.append('{1} &out{0} = _raw_out{0}{2};'.format(
+            i, _get_typename(args_info[i + len(in_types)][1]), index))
 
     op.append(routine)
     operation = '\n'.join(op)
@@ -582,15 +743,24 @@ def _get_ufunc_kernel(
         kernel_params, operation, name, preamble)
 
 
+cdef bint _can_cast(from_type, to_type) except *:
+    # Scalar values are passed when the minimum scalar type is needed; they
+    # are left to numpy.can_cast.
+    if isinstance(from_type, type):
+        ret = _cast_table.get((from_type, to_type))
+        if ret is not None:
+            return ret
+    return numpy.can_cast(from_type, to_type)
+
+
 cdef tuple _guess_routine_from_in_types(list ops, tuple in_types):
     cdef Py_ssize_t i, n
     cdef tuple op, op_types
     n = len(in_types)
-    can_cast = numpy.can_cast
     for op in ops:
         op_types = op[0]
         for i in range(n):
-            if not can_cast(in_types[i], op_types[i]):
+            if not _can_cast(in_types[i], op_types[i]):
                 break
         else:
             return op
@@ -664,12 +834,12 @@ class ufunc(object):
 
     """
     def __init__(self, name, nin, nout, ops, preamble='', doc=''):
-        self.name = name
+        self.name = six.moves.intern(name)
         self.nin = nin
         self.nout = nout
         self.nargs = nin + nout
         self._ops = ops
-        self._preamble = preamble
+        self._preamble = six.moves.intern(preamble)
         self.__doc__ = doc
         _in_params = tuple(
             ParameterInfo('T in%d' % i, True)
@@ -680,6 +850,8 @@ class ufunc(object):
         self._params = _in_params + _out_params + (
             ParameterInfo('CIndexer _ind', False),)
         self._routine_cache = {}
+        self._kernel_memo = {}
+        util.register_memo(self, self._kernel_memo)
 
     def __repr__(self):
         return "<ufunc '%s'>" % self.name
@@ -745,8 +917,7 @@ class ufunc(object):
             out_args = _preprocess_args((out,))
             args += out_args
 
-        broad = broadcast(*args)
-        shape = broad.shape
+        values, shape = _fast_broadcast(args)
 
         in_types, out_types, routine = _guess_routine(
             self.name, self._routine_cache, self._ops, in_args, dtype)
@@ -762,21 +933,107 @@ class ufunc(object):
 
         inout_args = []
         for i, t in enumerate(in_types):
-            x = broad.values[i]
+            x = values[i]
             inout_args.append(x if isinstance(x, ndarray) else t(x))
         inout_args.extend(out_args)
         inout_args, shape = _reduce_dims(inout_args, self._params, shape)
+        contiguous_1d = _is_contiguous_1d(inout_args, self._params, shape)
         indexer = Indexer(shape)
         inout_args.append(indexer)
         args_info = _get_args_info(inout_args)
 
-        kern = _get_ufunc_kernel(
-            in_types, out_types, routine, args_info,
-            self._params, self.name, self._preamble)
+        key = (device.get_device_id(), in_types, out_types, routine,
+               args_info, contiguous_1d)
+        kern = self._kernel_memo.get(key)
+        if kern is None:
+            kern = _get_ufunc_kernel(
+                in_types, out_types, routine, args_info,
+                self._params, self.name, self._preamble, contiguous_1d)
+            self._kernel_memo[key] = kern
 
         kern.linear_launch(indexer.size, inout_args)
         return ret
 
+    def _warmup(self, in_types, int ndim=1):
+        # Compiles the kernel without launching it. See prefetch_kernels for
+        # the arguments.
+        cdef int kind, max_array_kind = -1, max_scalar_kind = -1
+        array_types, scalars = _get_warmup_in_types(
+            in_types, self.nin, self.name)
+        for t, x in zip(array_types, scalars):
+            if t is None:
+                kind = _kind_score[x.dtype.kind]
+                max_scalar_kind = max(max_scalar_kind, kind)
+            else:
+                kind = _kind_score[numpy.dtype(t).kind]
+                max_array_kind = max(max_array_kind, kind)
+        # The same rule as _check_should_use_min_scalar.
+        use_raw_value = (max_scalar_kind != -1 and
+                         max_array_kind >= max_scalar_kind)
+        guess_types = tuple([
+            t if t is not None else x if use_raw_value else x.dtype.type
+            for t, x in zip(array_types, scalars)])
+        op = _guess_routine_from_in_types(self._ops, guess_types)
+        if op is None:
+            raise TypeError('Wrong type of arguments for %s' % self.name)
+        op_in_types, out_types, routine = op
+        args_info = [(ndarray, t, ndim) if t is not None else (s, s, 0)
+                     for t, s in zip(array_types, op_in_types)]
+        args_info += [(ndarray, t, ndim) for t in out_types]
+        args_info.append((Indexer, None, ndim))
+        return _get_ufunc_kernel(
+            op_in_types, out_types, routine, tuple(args_info),
+            self._params, self.name, self._preamble, ndim == 1)
+
+
+def _prefetch_kernel(task):
+    dev_id, kernel, in_types, ndim = task
+    with device.Device(dev_id):
+        # Makes the context of the device current in this thread.
+        runtime.free(0)
+        kernel._warmup(in_types, ndim)
+
+
+def prefetch_kernels(kernels, max_workers=None):
+    """Compiles elementwise kernels and ufuncs concurrently.
+
+    Each kernel is compiled for the current device in a thread pool, and the
+    results are stored to the same caches as used by the kernel invocation.
+    It hides the compilation time of the kernels used at the first time, e.g.
+    by calling this function at the beginning of a program.
+
+    Args:
+        kernels: Iterable of ``(kernel, in_types)`` or
+            ``(kernel, in_types, ndim)`` tuples. ``kernel`` is an
+            :class:`cupy.ElementwiseKernel` or :class:`cupy.ufunc` object,
+            ``in_types`` is a sequence of the dtypes of the input arrays and
+            ``ndim`` is the number of dimensions of the arrays after the
+            reduction of dimensions. ``ndim`` is ``1`` by default, which
+            corresponds to contiguous arrays. A scalar input is specified by
+            a scalar value instead of a dtype, since the type of a scalar may
+            depend on its value. Elementwise kernels with ``raw`` parameters
+            are not supported.
+        max_workers (int): Number of threads. The number of CPUs is used by
+            default.
+
+    """
+    import multiprocessing.pool
+
+    util.experimental('cupy.prefetch_kernels')
+    dev_id = device.get_device_id()
+    tasks = []
+    for k in kernels:
+        ndim = k[2] if len(k) > 2 else 1
+        tasks.append((dev_id, k[0], tuple(k[1]), ndim))
+    if not tasks:
+        return
+    pool = multiprocessing.pool.ThreadPool(max_workers)
+    try:
+        pool.map(_prefetch_kernel, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
 
 cpdef create_ufunc(name, ops, routine=None, preamble='', doc=''):
     _ops = []
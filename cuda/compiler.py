@@ -105,11 +105,20 @@ def get_cache_dir():
     return os.environ.get('CUPY_CACHE_DIR', _default_cache_dir)
 
 
-_empty_file_preprocess_cache = {}
+def _get_cache_key(source, options, arch):
+    # Only sources including external headers need to be preprocessed; any
+    # other source is identified by its text and the compile environment.
+    env = (arch, options, _get_nvcc_version())
+    if '#include' in source:
+        key_src = '%s %s' % (env, preprocess(source, options))
+    else:
+        key_src = '%s %s' % (env, source)
+    if isinstance(key_src, six.text_type):
+        key_src = key_src.encode('utf-8')
+    return hashlib.sha256(key_src).hexdigest()
 
 
 def compile_with_cache(source, options=(), arch=None, cache_dir=None):
-    global _empty_file_preprocess_cache
     if cache_dir is None:
         cache_dir = get_cache_dir()
     if arch is None:
@@ -122,18 +131,7 @@ def compile_with_cache(source, options=(), arch=None, cache_dir=None):
         elif sys.maxsize == 2147483647:
             options += '-m32',
 
-    env = (arch, options, _get_nvcc_version())
-    if '#include' in source:
-        pp_src = '%s %s' % (env, preprocess(source, options))
-    else:
-        base = _empty_file_preprocess_cache.get(env, None)
-        if base is None:
-            base = _empty_file_preprocess_cache[env] = preprocess('', options)
-        pp_src = '%s %s %s' % (env, base, source)
-
-    if isinstance(pp_src, six.text_type):
-        pp_src = pp_src.encode('utf-8')
-    name = '%s.cubin' % hashlib.md5(pp_src).hexdigest()
+    name = '%s.cubin' % _get_cache_key(source, options, arch)
 
     mod = function.Module()
 
@@ -147,16 +145,21 @@ def compile_with_cache(source, options=(), arch=None, cache_dir=None):
     lock_path = os.path.join(cache_dir, 'lock_file.lock')
 
     path = os.path.join(cache_dir, name)
-    with filelock.FileLock(lock_path) as lock:
-        if os.path.exists(path):
-            with open(path, 'rb') as file:
-                cubin = file.read()
-        else:
-            lock.release()
-            cubin = nvcc(source, options, arch)
-            lock.acquire()
-            with open(path, 'wb') as cubin_file:
-                cubin_file.write(cubin)
+    if os.path.exists(path):
+        # A cached file is always complete because it is created by rename.
+        with open(path, 'rb') as file:
+            cubin = file.read()
+    else:
+        cubin = nvcc(source, options, arch)
+        with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix='.tmp', delete=False) as cubin_file:
+            cubin_file.write(cubin)
+            temp_path = cubin_file.name
+        with filelock.FileLock(lock_path):
+            if os.path.exists(path):
+                os.unlink(temp_path)
+            else:
+                os.rename(temp_path, path)
 
     mod.load(cubin)
 
@@ -1,8 +1,8 @@
 # distutils: language = c++
 
 import atexit
-
-import six
+import threading
+import weakref
 
 from cupy.cuda cimport cublas
 from cupy.cuda cimport runtime
@@ -14,19 +14,76 @@ except ImportError:
     cusolver_enabled = False
 
 
+# The current device of each host thread is cached together with the number of
+# switches made by runtime.setDevice, so that any switch made through it,
+# either by Device or directly, invalidates the cache. A switch made by a
+# direct cudaSetDevice call from another library is not seen.
+cdef object _thread_local = threading.local()
+
+
 cpdef int get_device_id() except *:
-    return runtime.getDevice()
+    cdef size_t count = runtime._get_set_device_count()
+    cached = getattr(_thread_local, 'device', None)
+    if cached is not None and (<tuple>cached)[1] == count:
+        return (<tuple>cached)[0]
+    dev_id = runtime.getDevice()
+    _thread_local.device = (dev_id, count)
+    return dev_id
+
+
+cdef _set_device(int device_id):
+    runtime.setDevice(device_id)
+    _thread_local.device = (device_id, runtime._get_set_device_count())
 
 
-cdef dict _cublas_handles = {}
+# cuBLAS handles must not be shared among host threads, so each thread keeps
+# its own handles in a _CublasHandles stored in the thread-local storage.
+cdef object _cublas_handles_holders = weakref.WeakSet()
 cdef dict _cusolver_handles = {}
 
 
+cdef class _CublasHandles:
+
+    """cuBLAS handles of a host thread, destroyed together with the thread."""
+
+    cdef:
+        dict handles
+        object __weakref__
+
+    def __init__(self):
+        self.handles = {}
+
+    def __dealloc__(self):
+        self.destroy()
+
+    cdef destroy(self):
+        if not self.handles:
+            return
+        cdef int current = runtime.getDevice()
+        try:
+            while self.handles:
+                dev_id, handle = self.handles.popitem()
+                runtime.setDevice(dev_id)
+                cublas.destroy(handle)
+        finally:
+            runtime.setDevice(current)
+
+
+cdef dict _get_cublas_handles():
+    holder = getattr(_thread_local, 'cublas_handles', None)
+    if holder is None:
+        holder = _CublasHandles()
+        _thread_local.cublas_handles = holder
+        _cublas_handles_holders.add(holder)
+    return (<_CublasHandles>holder).handles
+
+
 cpdef get_cublas_handle():
     dev_id = get_device_id()
-    if dev_id in _cublas_handles:
-        return _cublas_handles[dev_id]
-    return Device().cublas_handle
+    handle = _get_cublas_handles().get(dev_id)
+    if handle is None:
+        return Device(dev_id).cublas_handle
+    return handle
 
 
 cpdef get_cusolver_handle():
@@ -64,7 +121,7 @@ cdef class Device:
 
     def __init__(self, device=None):
         if device is None:
-            self.id = runtime.getDevice()
+            self.id = get_device_id()
         else:
             self.id = int(device)
 
@@ -74,14 +131,14 @@ cdef class Device:
         return self.id
 
     def __enter__(self):
-        cdef int id = runtime.getDevice()
+        cdef int id = get_device_id()
         self._device_stack.append(id)
         if self.id != id:
             self.use()
         return self
 
     def __exit__(self, *args):
-        runtime.setDevice(self._device_stack.pop())
+        _set_device(self._device_stack.pop())
 
     def __repr__(self):
         return '<CUDA Device %d>' % self.id
@@ -92,7 +149,7 @@ cdef class Device:
         If you want to switch a device temporarily, use the *with* statement.
 
         """
-        runtime.setDevice(self.id)
+        _set_device(self.id)
 
     cpdef synchronize(self):
         """Synchronizes the current thread to the device."""
@@ -116,16 +173,17 @@ cdef class Device:
     def cublas_handle(self):
         """The cuBLAS handle for this device.
 
-        The same handle is used for the same device even if the Device instance
-        itself is different.
+        The same handle is used for the same device and the same thread even
+        if the Device instance itself is different.
 
         """
-        if self.id in _cublas_handles:
-            return _cublas_handles[self.id]
-        with self:
-            handle = cublas.create()
-            _cublas_handles[self.id] = handle
-            return handle
+        cdef dict handles = _get_cublas_handles()
+        handle = handles.get(self.id)
+        if handle is None:
+            with self:
+                handle = cublas.create()
+            handles[self.id] = handle
+        return handle
 
     @property
     def cusolver_handle(self):
@@ -178,7 +236,5 @@ def from_pointer(ptr):
 @atexit.register
 def destroy_cublas_handles():
     """Destroys the cuBLAS handles for all devices."""
-    global _cublas_handles
-    for handle in six.itervalues(_cublas_handles):
-        cublas.destroy(handle)
-    _cublas_handles = {}
+    for holder in list(_cublas_handles_holders):
+        (<_CublasHandles>holder).destroy()
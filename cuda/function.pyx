@@ -64,8 +64,9 @@ cdef inline CPointer _pointer(x):
     cdef Py_ssize_t itemsize
     if x is None:
         return CPointer()
-    if hasattr(x, 'cstruct'):
-        return x.cstruct
+    cstruct = getattr(x, 'cstruct', None)
+    if cstruct is not None:
+        return cstruct
 
     if type(x) not in _pointer_numpy_types:
         if isinstance(x, six.integer_types):
@@ -12,6 +12,7 @@ cdef class MemoryPointer:
 
     cdef:
         readonly device.Device device
+        readonly int device_id
         readonly object mem
         readonly size_t ptr
 
@@ -78,6 +78,8 @@ cdef class MemoryPointer:
 
     Attributes:
         device (cupy.cuda.Device): Device whose memory the pointer refers to.
+        device_id (int): ID of the device, or ``-1`` if ``device`` is
+            ``None``.
         mem (Memory): The device memory buffer.
         ptr (int): Pointer to the place within the buffer.
     """
@@ -85,6 +87,7 @@ cdef class MemoryPointer:
     def __init__(self, mem, Py_ssize_t offset):
         self.mem = mem
         self.device = mem.device
+        self.device_id = -1 if self.device is None else self.device.id
         self.ptr = mem.ptr + offset
 
     def __int__(self):
@@ -80,6 +80,7 @@ cpdef int getDevice() except *
 cpdef int deviceGetAttribute(int attrib, int device) except *
 cpdef int getDeviceCount() except *
 cpdef setDevice(int device)
+cdef size_t _get_set_device_count()
 cpdef deviceSynchronize()
 
 cpdef int deviceCanAccessPeer(int device, int peerDevice) except *
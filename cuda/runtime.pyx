@@ -152,6 +152,15 @@ cpdef int runtimeGetVersion() except *:
 # Device and context operations
 ###############################################################################
 
+# Number of device switches made by setDevice. It lets caches of the current
+# device, e.g. in cupy.cuda.device, detect the switches.
+cdef size_t _set_device_count = 0
+
+
+cdef size_t _get_set_device_count():
+    return _set_device_count
+
+
 cpdef int getDevice() except *:
     cdef int device
     status = cudaGetDevice(&device)
@@ -174,8 +183,10 @@ cpdef int getDeviceCount() except *:
 
 
 cpdef setDevice(int device):
+    global _set_device_count
     status = cudaSetDevice(device)
     check_status(status)
+    _set_device_count += 1
 
 
 cpdef deviceSynchronize():
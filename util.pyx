@@ -3,12 +3,52 @@
 import atexit
 import functools
 import warnings
+import weakref
 
 import cupy
 from cupy.cuda cimport device
 
 
 cdef list _memos = []
+# Memo dicts owned by objects, e.g. kernels, keyed by the owners so that they
+# are released together with the owners.
+cdef object _instance_memos = weakref.WeakKeyDictionary()
+cdef object _missing = object()
+
+
+def _memoize_per_device(f, dict memo):
+    @functools.wraps(f)
+    def ret(*args, **kwargs):
+        cdef int id = device.get_device_id()
+        if kwargs:
+            arg_key = (id, args, tuple(sorted(kwargs.items())))
+        else:
+            arg_key = (id, args)
+        result = memo.get(arg_key, _missing)
+        if result is _missing:
+            result = f(*args, **kwargs)
+            memo[arg_key] = result
+        return result
+
+    return ret
+
+
+def _memoize_global(f, dict memo):
+    @functools.wraps(f)
+    def ret(*args, **kwargs):
+        if kwargs:
+            # The private sentinel keeps this key distinct from any tuple of
+            # positional arguments.
+            arg_key = (_missing, args, tuple(sorted(kwargs.items())))
+        else:
+            arg_key = args
+        result = memo.get(arg_key, _missing)
+        if result is _missing:
+            result = f(*args, **kwargs)
+            memo[arg_key] = result
+        return result
+
+    return ret
 
 
 def memoize(bint for_each_device=False):
@@ -25,31 +65,39 @@ def memoize(bint for_each_device=False):
     def decorator(f):
         memo = {}
         _memos.append(memo)
-
-        @functools.wraps(f)
-        def ret(*args, **kwargs):
-            cdef int id = -1
-            cdef dict m = memo
-            if for_each_device:
-                id = device.get_device_id()
-            arg_key = (id, args, frozenset(kwargs.items()))
-            if arg_key in m:
-                result = m[arg_key]
-            else:
-                result = f(*args, **kwargs)
-                m[arg_key] = result
-            return result
-
-        return ret
+        if for_each_device:
+            return _memoize_per_device(f, memo)
+        else:
+            return _memoize_global(f, memo)
 
     return decorator
 
 
+def register_memo(owner, dict memo):
+    """Registers a memo dict owned by an object to be cleared by clear_memo.
+
+    The memo is only weakly tied to the owner; it is unregistered when the
+    owner is garbage-collected.
+
+    Args:
+        owner: Object that holds the memo. It must support weak references.
+        memo (dict): Memo dict to be cleared by :func:`clear_memo`.
+
+    """
+    _instance_memos[owner] = memo
+
+
 @atexit.register
 def clear_memo():
-    """Clears the memoized results for all functions decorated by memoize."""
+    """Clears the memoized results for all functions decorated by memoize.
+
+    Memo dicts registered by :func:`register_memo` are also cleared.
+
+    """
     for memo in _memos:
         memo.clear()
+    for memo in list(_instance_memos.values()):
+        memo.clear()
 
 
 def experimental(api_name):